@@ -1,12 +1,23 @@
 from typing import Dict, List # For advanced type hints.
 from glob import glob         # For batch file operations.
+import concurrent.futures     # For reading and writing files in parallel.
 import pandas as pd           # For advanced data manipulation.
-import contextlib             # For safely removing files.
-import subprocess             # For calling the compiler.
+import contextlib             # For capturing the messages of worker processes.
+import numpy as np            # For vectorised array operations.
+import subprocess             # For calling the neverwinter.nim binaries.
 import shutil                 # For OS-agnostic file operations.
-import json                   # For storing script hashes.
-import sys                    # For command line arguments.
+import json                   # For reading and writing JSON files.
+import io                     # For buffering the messages of worker processes.
+import sys                    # For platform checks and string interning.
 import os                     # For OS-level operations.
+try:                          # Optional: pyarrow-backed strings make label columns faster to hash and compare.
+    import pyarrow as pa
+except ImportError:
+    pa = None
+try:                          # Optional: orjson reads and writes JSON much faster than the json module.
+    import orjson
+except ImportError:
+    orjson = None
 
 class IOHelper():
     '''A collection of helpers for reading and writing 2DA, TLK and JSON label files.'''
@@ -27,35 +38,48 @@ class IOHelper():
         '''Reads a JSON file containing TLK labels and returns it as a pandas DataFrame.'''
         if not os.path.isfile(json_path) or not json_path.lower().endswith('.json'):
             return pd.DataFrame()
-        # Attempt to read the JSON file using different encodings.
-        for encoding in ['utf-8', 'utf-8-sig']:
-            try:
-                df = pd.read_json(json_path, encoding=encoding)
-                break
-            except ValueError:
-                continue
+        # Read the JSON file as UTF-8, with or without a byte order mark.
+        with open(json_path, 'rb') as f:
+            df = pd.DataFrame(IOHelper.load_json(f.read().removeprefix(b'\xef\xbb\xbf')))
         if 'id' not in df.columns:
             raise ValueError(f'Unable to proceed due to missing ID column in JSON file: {json_path}')
-        df['id'] = df['id'].astype(int)
-        df.set_index('id', inplace=True)
-        # sort the index to ensure it is in ascending order.
-        df.sort_index(inplace=True)
-        # Check for duplicates in the index.
-        if not silent_warnings and df.index.duplicated().any():
-            # Keep the last occurrence of each duplicate index and warn the user.
-            print(f'W: {os.path.basename(json_path)}: Duplicate entries for 2DA row(s): {df.index[df.index.duplicated()].tolist()}')
-            df = df[~df.index.duplicated(keep='last')]
+        # Use the IDs as an ascending index. A stable sort keeps duplicate IDs in file order.
+        ids = df.pop('id').to_numpy(dtype=np.int64)
+        order = np.argsort(ids, kind='stable')
+        df = df.iloc[order]
+        df.index = pd.Index(ids[order], name='id')
+        # Check for duplicates in the index, keeping the last occurrence of each.
+        duplicates = df.index.duplicated(keep='last')
+        if duplicates.any():
+            # Drop the earlier occurrences and warn the user.
+            if not silent_warnings:
+                print(f'W: {os.path.basename(json_path)}: Duplicate entries for 2DA row(s): {df.index[duplicates].tolist()}')
+            df = df.loc[~duplicates]
+        if pa:
+            # Store labels as pyarrow strings, which are hashed and compared without touching Python objects.
+            df = df.astype({column: 'string[pyarrow]' for column in df.select_dtypes('object').columns})
         return df
 
+    @staticmethod
+    def load_json(data : bytes) -> object:
+        '''Deserializes UTF-8 encoded JSON data, using orjson if it is available.'''
+        return orjson.loads(data) if orjson else json.loads(data)
+
+    @staticmethod
+    def dump_json(obj : object) -> bytes:
+        '''Serializes an object to UTF-8 encoded JSON data, using orjson if it is available.'''
+        return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
+
     @staticmethod
     def read_2da(file_path : str, validate_index : bool = True) -> pd.DataFrame:
         '''Converts a 2DA file to a pandas DataFrame.'''
         if not os.path.isfile(file_path) or not file_path.lower().endswith('.2da'):
             raise FileNotFoundError(f'Unable to proceed due to invalid 2DA file path: {file_path}')
         try:
+            # Pandas treats this separator as a special case, which its C engine handles natively.
             df = pd.read_csv(file_path, encoding='ISO-8859-1',
                              sep=r'\s+', quotechar='"',
-                             skiprows=2, index_col=0)
+                             skiprows=2, index_col=0, engine='c')
         except pd.errors.ParserError as e:
             print(f'E: {os.path.basename(file_path)}: {str(e).replace("C error: ", "")}\nStopping TLK generation on first error.\n\n1 error; see above for context.\n\nProcessing aborted.')
             exit(1)
@@ -69,15 +93,10 @@ class IOHelper():
     @staticmethod
     def write_2da(df_2da : pd.DataFrame, file_path : str) -> None:
         "Writes a DataFrame representing 2DA contents to a 2DA file."
-        # Export the DataFrame to a CSV file.
-        df_2da.to_csv(file_path, sep=' ', quotechar='"', index_label='')
-        # Append the generated CSV file to the 2DA header.
-        text = '2DA V2.0\n\n'
-        with open(file_path, 'r') as f:
-            text += f.read().strip()
-        # Then overwrite the original 2DA file with the updated text.
+        # Write the 2DA and column headers, then append the DataFrame's rows to them.
         with open(file_path, 'w') as f:
-            f.write(text + '\n')
+            f.write('2DA V2.0\n\n' + ' '.join(df_2da.columns) + '\n')
+            df_2da.to_csv(f, sep=' ', quotechar='"', header=False, lineterminator='\n')
 
     def write_hak(self, input_directory : str, output_path : str) -> None:
         '''Packages the contents of a directory into a HAK file.'''
@@ -85,17 +104,23 @@ class IOHelper():
         if not os.path.isdir(input_directory):
             raise FileNotFoundError(f'Unable to proceed due to invalid directory: {input_directory}')
         # Package the directory into a HAK file using nwn_erf.
-        subprocess.run([self.nwn_erf,
-                        '-e', 'HAK',           # Override ERF header type to HAK.
-                        '-c', input_directory, # Create archive from input files or directories.
-                        '-f', output_path])    # Operate on FILE instead of stdin/out
+        IOHelper.run_binary([self.nwn_erf,
+                             '-e', 'HAK',           # Override ERF header type to HAK.
+                             '-c', input_directory, # Create archive from input files or directories.
+                             '-f', output_path],    # Operate on FILE instead of stdin/out
+                            stdin=subprocess.DEVNULL)
+
+    @staticmethod
+    def run_binary(args : List[str], **kwargs) -> subprocess.CompletedProcess:
+        '''Runs one of the neverwinter.nim binaries directly, without a shell.'''
+        # The binaries don't use any inherited file descriptors, so POSIX systems needn't spend time closing them.
+        return subprocess.run(args, close_fds=sys.platform == 'win32', **kwargs)
 
 class TLK():
     '''A class representing the contents of a TLK file.'''
 
-    # Define the temporary directory and file for TLK operations.
+    # Define the temporary directory for TLK operations.
     TEMP_DIR  = os.path.join(os.path.split(__file__)[0], 'tmp', '.tlkify')
-    TEMP_FILE = os.path.join(TEMP_DIR, f'.tmp.json')
 
     # An offset that differentiates custom TLK entries from standard ones.
     OFFSET = 16777216
@@ -113,13 +138,16 @@ class TLK():
         # Store the input directories.
         self.input_2das  = input_2da_folder
         self.input_json  = input_json_folder
-        # TLK values are stored as a dictionary with 'language' and 'entries' keys.
-        # - The 'language' key is an integer representing the language of the TLK file.
-        # - The 'entries' key is a list of dictionaries with 'id' and 'text' keys.
-        self.values = {
-            'language': 0,
-            'entries': []
-        }
+        # The language is an integer representing the language of the TLK file.
+        self.language = 0
+        # TLK entries are stored as two parallel lists of IDs and texts.
+        # They're only converted to a list of dictionaries when exporting the TLK.
+        self.ids   = []
+        self.texts = []
+        # Imported entries may have additional fields, such as 'sound'. They're kept by ID and restored on export.
+        self.extras = {}
+        # The highest ID in use is tracked separately, so it needn't be recomputed for each new entry.
+        self.max_id = -1
         # We'll cache entries to avoid duplicates.
         self.existing = {}
         # To keep track of empty keys, we store a list of them.
@@ -128,40 +156,47 @@ class TLK():
     def __len__(self) -> int:
         '''Returns the number of entries in this TLK.'''
         # The length of a TLK is the number of entries it contains.
-        return len(self.values['entries'])
+        return len(self.ids)
 
     def __repr__(self) -> str:
         '''Returns a string representation of this TLK object.'''
         # Create a table of the TLK contents.
-        content_table = [str({entry["id"]: entry['text'].replace('\n', '\\n')})[1:-1]
-                         for entry in self.values['entries']]
+        content_table = [str({id: text.replace('\n', '\\n')})[1:-1]
+                         for id, text in zip(self.ids, self.texts)]
         return ',\n'.join(content_table)
 
     def __add_item__(self, id : int, text : str) -> None:
         '''Internal function. Adds a new entry to this TLK instance.'''
-        # TLK contents are stored as a list of dictionaries with 'id' and 'text' keys.
+        # TLK contents are stored as parallel lists of IDs and texts.
         self.existing[text] = id + TLK.OFFSET
-        self.values['entries'].append({
-            'id': id,
-            'text': text
-        })
+        self.ids.append(id)
+        self.texts.append(text)
+        self.max_id = max(self.max_id, id)
 
     def add(self, text : str) -> int:
         '''Adds a new entry to this TLK instance and returns its ID.'''
+        # Intern the text, so recurring labels share one string object and dictionary lookups can compare by identity.
+        if type(text) is str:
+            text = sys.intern(text)
         # If the text already exists, return its cached ID.
-        if text in self.existing:
-            return self.existing[text]
-
-        # TLK contents are stored as a list of dictionaries with 'id' and 'text' keys.
-        id = self.blanks.pop() if self.blanks else len(self)
-        self.__add_item__(id, text)
-        return self.existing[text]
+        existing_id = self.existing.get(text)
+        if existing_id is not None:
+            return existing_id
+
+        # This is a hot path, so we'll add the entry directly instead of calling __add_item__.
+        id = self.blanks.pop() if self.blanks else len(self.ids)
+        self.ids.append(id)
+        self.texts.append(text)
+        if id > self.max_id:
+            self.max_id = id
+        existing_id = self.existing[text] = id + TLK.OFFSET
+        return existing_id
 
     def add_id(self, id : int, text : str) -> int:
         '''Adds a new entry to this TLK instance with the given ID. This ID must exceed the current maximum.'''
         # Ensure the given ID is valid.
-        max_value = max(self.existing.values()) - TLK.OFFSET if len(self.existing) > 0 else 0
-        if max_value and id <= max_value:
+        max_value = self.max_id
+        if id <= max_value:
             raise ValueError(f'ID {id} must be greater than the current maximum of {max_value}.')
 
         # Add the new entry to the list of entries, then add the range of missing IDs to the blanks set.
@@ -169,15 +204,39 @@ class TLK():
         self.blanks.update(range(max_value + 1, id))
         return self.existing[text]
 
-    def add_2da_labels(self, name : str, spell_name_desc_offset : int = 5000) -> pd.DataFrame:
-        '''Updates this TLK object with the contents of a 2DA DataFrame.'''
+    def add_ids(self, ids : np.ndarray, texts : np.ndarray) -> None:
+        '''Adds new entries to this TLK instance with the given ascending IDs. These IDs must exceed the current maximum.'''
+        if len(ids) == 0:
+            return
+        # Ensure the given IDs are valid.
+        max_value = self.max_id
+        if ids[0] <= max_value:
+            raise ValueError(f'ID {ids[0]} must be greater than the current maximum of {max_value}.')
+
+        # Add the new entries in bulk, then add the range of missing IDs to the blanks set.
+        ids = ids.tolist()
+        self.ids.extend(ids)
+        self.texts.extend(texts)
+        self.existing.update(zip(texts, (id + TLK.OFFSET for id in ids)))
+        self.max_id = ids[-1]
+        self.blanks.update(set(range(max_value + 1, self.max_id)).difference(ids))
+
+    @staticmethod
+    def read_2da_labels(name : str, input_2da_folder : str, input_json_folder : str) -> tuple[pd.DataFrame, pd.DataFrame]:
+        '''Reads a 2DA file and its JSON labels, including any missing labels. Independent of any TLK instance.'''
         # Load the 2DA and JSON files.
-        df_2da  = IOHelper.read_2da(os.path.join(self.input_2das, f'{name}.2da'))
-        df_json = IOHelper.read_labels(os.path.join(self.input_json, f'{name}.json'))
-        df_json = self.add_missing_labels(name, df_2da, df_json)
+        df_2da  = IOHelper.read_2da(os.path.join(input_2da_folder, f'{name}.2da'))
+        df_json = IOHelper.read_labels(os.path.join(input_json_folder, f'{name}.json'))
+        df_json = TLK.add_missing_labels(name, df_2da, df_json, input_2da_folder, input_json_folder)
 
         # Drop any columns that are not in the 2DA file.
-        df_json = df_json[df_json.columns.intersection(df_2da.columns)]
+        return df_2da, df_json[df_json.columns.intersection(df_2da.columns)]
+
+    def add_2da_labels(self, name : str, spell_name_desc_offset : int = 5000,
+                       labels : tuple[pd.DataFrame, pd.DataFrame] | None = None) -> pd.DataFrame:
+        '''Updates this TLK object with the contents of a 2DA DataFrame. Optionally takes the output of read_2da_labels.'''
+        # Load the 2DA and JSON files, unless they've been read already.
+        df_2da, df_json = labels if labels else TLK.read_2da_labels(name, self.input_2das, self.input_json)
         if df_json.empty:
             return df_2da
 
@@ -186,41 +245,91 @@ class TLK():
             return self.add_spell_labels(df_2da, df_json, spell_name_desc_offset)
 
         # Generate TLK references for all columns, then update the 2DA file.
-        df_json = df_json.map(self.add, na_action='ignore')
-        df_2da.update(df_json, overwrite=True)
+        TLK.__update_2da__(df_2da, self.__add_labels__(df_json))
         return df_2da
 
+    @staticmethod
+    def __update_2da__(df_2da : pd.DataFrame, df_ids : pd.DataFrame) -> None:
+        '''Internal function. Overwrites 2DA cells with all non-missing values of a DataFrame with matching columns.'''
+        # Look up the source row of each 2DA row, so repeated 2DA row numbers are all updated.
+        if not df_ids.index.is_unique:
+            df_ids = df_ids[~df_ids.index.duplicated(keep='last')]
+        sources = df_ids.index.get_indexer(df_2da.index)
+        # Ignore 2DA rows without a source row, as well as source rows that don't exist in the 2DA file.
+        rows    = np.flatnonzero(sources >= 0)
+        sources = sources[rows]
+        for column in df_ids.columns:
+            values   = df_ids[column].to_numpy()[sources]
+            assigned = pd.notna(values)
+            if assigned.any():
+                cells = df_2da[column].to_numpy(copy=True)
+                cells[rows[assigned]] = values[assigned]
+                df_2da[column] = cells
+
+    def __add_labels__(self, df_labels : pd.DataFrame) -> pd.DataFrame:
+        '''Internal function. Adds all labels of a DataFrame to this TLK instance and returns a DataFrame of their IDs.'''
+        if df_labels.columns.empty:
+            return df_labels.copy()
+        # Flatten the labels column by column, so IDs are assigned in the same order as a column-wise map.
+        labels = pd.concat([df_labels[column] for column in df_labels.columns], ignore_index=True)
+        labelled = labels.notna().to_numpy()
+        # Add each distinct label only once, then map the resulting IDs back onto every cell.
+        codes, uniques = pd.factorize(labels[labelled])
+        ids = np.fromiter((self.add(text) for text in uniques), dtype=np.int64, count=len(uniques))
+        values = np.full(len(labels), np.nan, dtype=object)
+        values[labelled] = ids[codes]
+        return pd.DataFrame(values.reshape(df_labels.shape, order='F'),
+                            index=df_labels.index, columns=df_labels.columns)
+
     def add_spell_labels(self, df_2da : pd.DataFrame, df_json : pd.DataFrame, name_desc_offset : int) -> pd.DataFrame:
         '''Updates this TLK object with the contents of the spells.2da DataFrame.'''
         # If a name_desc_offset was specified, assign static Name and SpellDesc IDs in the TLK file.
         STATIC_COLUMNS = ('Name', 'SpellDesc') if name_desc_offset > 0 else ()
 
         # Most columns can be handled normally.
-        for column in df_json.columns.difference(STATIC_COLUMNS):
-            df_json[column] = df_json[column].map(self.add, na_action='ignore')
-        df_2da.update(df_json, overwrite=True)
-
-        if not STATIC_COLUMNS:
-            return df_2da
+        dynamic_columns = df_json.columns.difference(STATIC_COLUMNS)
+        TLK.__update_2da__(df_2da, self.__add_labels__(df_json[dynamic_columns]))
 
         # Determine static IDs via the 2DA row index and column order.
+        static_ids, static_texts = [], []
         df_ids = pd.DataFrame(index=df_json.index)
         for i, column in enumerate(STATIC_COLUMNS):
-            df_ids[column] = name_desc_offset + i + len(STATIC_COLUMNS) * df_ids.index
-            df_ids[column] = df_ids[column].where(df_json[column].notna(), df_json[column])
-
-        # Update this TLK with df_id's ids and df_json's TLK strings.
-        all(self.add_id(id=getattr(row, column),
-                        text=df_json.at[row[0], column])
-            for row in df_ids.itertuples()
-            for column in STATIC_COLUMNS
-            if pd.notna(getattr(row, column)))
-
-        # Update the 2DA file with the new TLK references.
-        df_2da.update(df_ids + TLK.OFFSET, overwrite=True)
+            if column not in df_json.columns:
+                continue
+            labelled = df_json[column].notna().to_numpy()
+            rows = df_json.index.to_numpy()[labelled]
+            static_ids.append(name_desc_offset + i + len(STATIC_COLUMNS) * rows.astype(np.int64))
+            static_texts.append(df_json[column].to_numpy()[labelled])
+            # Keep the references as integers, using an object column for the unlabelled rows.
+            df_ids[column] = np.full(len(df_json), np.nan, dtype=object)
+            df_ids.loc[labelled, column] = (static_ids[-1] + TLK.OFFSET).tolist()
+        if not static_ids:
+            return df_2da
+
+        # Update this TLK with the static IDs and df_json's TLK strings.
+        ids, texts = np.concatenate(static_ids), np.concatenate(static_texts)
+        order = np.argsort(ids, kind='stable')
+        ids, texts = ids[order], texts[order]
+        # A TLK reference may already contain static IDs, e.g. if it is the output of a previous run. Skip the ones
+        # whose text is unchanged, but stop if any other static ID falls within the reference's range of IDs.
+        used = ids <= self.max_id
+        if used.any():
+            reference = dict(zip(self.ids, self.texts))
+            clashes = [id for id, text in zip(ids[used].tolist(), texts[used]) if reference.get(id) != text]
+            if clashes:
+                print(f'E: spells.json: Static ID(s) {clashes} clash with the TLK reference, which uses IDs up to {self.max_id}. '
+                      f'Choose a spell_offset above {self.max_id} instead of {name_desc_offset}.\n\nProcessing aborted.')
+                exit(1)
+            ids, texts = ids[~used], texts[~used]
+        self.add_ids(ids, texts)
+
+        # Update the 2DA file with the new TLK references, ignoring rows that don't exist in the 2DA file.
+        TLK.__update_2da__(df_2da, df_ids)
         return df_2da
 
-    def add_missing_labels(self, name : str, df_2da : pd.DataFrame, df_json : pd.DataFrame) -> pd.DataFrame:
+    @staticmethod
+    def add_missing_labels(name : str, df_2da : pd.DataFrame, df_json : pd.DataFrame,
+                           input_2da_folder : str, input_json_folder : str) -> pd.DataFrame:
         '''Updates the given JSON label DataFrame with additional lowercase, plural and/or adjective forms.'''
         if name == 'classes':
             # Add plural and lowercase labels for classes, using 'Name' as a reference.
@@ -231,8 +340,7 @@ class TLK():
             if 'Plural' not in df_json.columns:
                 df_json['Plural'] = pd.Series()
             # Add missing labels to the JSON file.
-            df_json['Plural'] = df_json['Plural'].where(df_json['Plural'].notna(), df_json['Name']
-                                                 .map(TLK.__dynamic_plural__, na_action='ignore'))
+            df_json['Plural'] = df_json['Plural'].where(df_json['Plural'].notna(), TLK.__dynamic_plural__(df_json['Name']))
             df_json['Lower'] = df_json['Name'].str.lower()
         elif name == 'racialtypes':
             # Add plural and lowercase labels for races, using 'Name' as a reference.
@@ -247,17 +355,15 @@ class TLK():
             if 'ConverNameLower' not in df_json.columns:
                 df_json['ConverNameLower'] = pd.Series()
             # Add missing labels to the JSON file.
-            df_json['NamePlural'] = df_json['NamePlural'].where(df_json['NamePlural'].notna(), df_json['Name']
-                                                         .map(TLK.__dynamic_plural__, na_action='ignore'))
-            df_json['ConverName'] = df_json['ConverName'].where(df_json['ConverName'].notna(), df_json['Name']
-                                                         .map(TLK.__dynamic_adjective, na_action='ignore'))
+            df_json['NamePlural'] = df_json['NamePlural'].where(df_json['NamePlural'].notna(), TLK.__dynamic_plural__(df_json['Name']))
+            df_json['ConverName'] = df_json['ConverName'].where(df_json['ConverName'].notna(), TLK.__dynamic_adjective(df_json['Name']))
             df_json['ConverNameLower'] = df_json['ConverNameLower'].where(df_json['ConverNameLower'].notna(), df_json['ConverName'].str.lower())
             df_json['ConverNameLower'] = df_json['ConverNameLower'].where(df_json['ConverNameLower'].notna(), df_json['Name'].str.lower())
         elif name == 'iprp_spells':
             try:
                 # Load spells.2da and spells.json to reference spell names. Exclude feat spells and abilities.
-                df_spells = IOHelper.read_labels(os.path.join(self.input_json, f'spells.json'), silent_warnings=True).join(
-                            IOHelper.read_2da(os.path.join(self.input_2das, f'spells.2da')), rsuffix='_2da')[['Name', 'FeatID', 'UserType']]
+                df_spells = IOHelper.read_labels(os.path.join(input_json_folder, f'spells.json'), silent_warnings=True).join(
+                            IOHelper.read_2da(os.path.join(input_2da_folder, f'spells.2da')), rsuffix='_2da')[['Name', 'FeatID', 'UserType']]
                 df_spells = df_spells[(df_spells['FeatID'] == '****') & (df_spells['UserType'] == '1')]
             except FileNotFoundError:
                 print(f'W: spells.2da: File not found. iprp_spells may be missing labels.')
@@ -268,12 +374,13 @@ class TLK():
             original_columns = df_json.columns.to_list()
             df_json = df_json.reindex(df_2da.index)
 
-            # Create columns to join the JSON file with the 2DA file on.
-            df_spells['SpellIndex'] = df_spells.index.astype(int)
-            df_json['SpellIndex'] = df_2da['SpellIndex'].replace('****', -1).astype(int)
-            df_json = df_json.merge(df_spells, on='SpellIndex', how='left', suffixes=('', '_spells'))
+            # Look up each row's spell name via its SpellIndex, instead of merging the whole spells DataFrame.
+            spell_names = dict(zip(df_spells.index.to_numpy(), df_spells['Name'].to_numpy()))
+            spell_index = df_2da['SpellIndex'].replace('****', -1).astype(int)
+            # Keep the names as objects, so an empty lookup doesn't produce a float column that can't be concatenated.
+            df_json['Name_spells'] = spell_index.map(spell_names).astype(object)
             # Drop entries with missing SpellIndex values.
-            df_json = df_json[df_json['SpellIndex'] != -1]
+            df_json = df_json[spell_index != -1]
 
             # Add missing labels to the JSON file.
             df_json['Name'] = df_json['Name'].where(df_json['Name'].notna(),
@@ -281,65 +388,86 @@ class TLK():
             df_json = df_json[df_json['Name'].str.contains(r'\*{4}', na=True) == False][original_columns]
         elif name == 'iprp_feats':
             # Load feat.json to reference feat names.
-            df_feats = IOHelper.read_labels(os.path.join(self.input_json, f'feat.json'), silent_warnings=True)[['FEAT']]
+            df_feats = IOHelper.read_labels(os.path.join(input_json_folder, f'feat.json'), silent_warnings=True)[['FEAT']]
             # Before making any significant adjustments, remember the original columns.
             if 'Name' not in df_json.columns:
                 df_json['Name'] = pd.Series()
             original_columns = df_json.columns.to_list()
             df_json = df_json.reindex(df_2da.index)
 
-            # Create columns to join the JSON file with the 2DA file on.
-            df_feats['FeatIndex'] = df_feats.index.astype(int)
-            df_json['FeatIndex'] = df_2da['FeatIndex'].replace('****', -1).astype(int)
-            df_json = df_json.merge(df_feats, on='FeatIndex', how='left')
+            # Look up each row's feat name via its FeatIndex, instead of merging the whole feats DataFrame.
+            feat_names = dict(zip(df_feats.index.to_numpy(), df_feats['FEAT'].to_numpy()))
+            feat_index = df_2da['FeatIndex'].replace('****', -1).astype(int)
+            df_json['FEAT'] = feat_index.map(feat_names).astype(object)
             # Drop entries with missing FeatIndex values.
-            df_json = df_json[df_json['FeatIndex'] != -1]
+            df_json = df_json[feat_index != -1]
             # Add missing labels to the JSON file.
             df_json['Name'] = df_json['Name'].where(df_json['Name'].notna(), df_json['FEAT'])
             df_json = df_json[original_columns]
         return df_json
 
     @staticmethod
-    def __dynamic_plural__(text : str) -> str:
-        '''Returns a basic plural form of the given noun.'''
-        match text[-2:]:
-            case 'ch', 'is', 'sh':   return text + 'es'       # 'Witch' -> 'Witches'
-            case 'fe':               return text[:-2] + 'ves' # 'Wife' -> 'Wives'
-            case 'lf':               return text[:-1] + 'ves' # 'Elf' -> 'Elves'
-        match text[-1]:
-            case 's', 'x', 'z', 'o': return text + 'es'       # 'Class' -> 'Classes'
-            case 'f':                return text[:-1] + 'ves' # 'Dwarf' -> 'Dwarves'
-            case 'y':
-                if text[-2] not in 'aeiou':
-                    return text[:-1] + 'ies'                  # 'City' -> 'Cities'
-        return text + 's'
+    def __dynamic_plural__(nouns : pd.Series) -> pd.Series:
+        '''Returns basic plural forms of the given nouns.'''
+        last_two, last, second_last = nouns.str[-2:], nouns.str[-1], nouns.str[-2]
+        conditions = [last_two.isin(('ch', 'is', 'sh')),                    # 'Witch' -> 'Witches'
+                      last_two == 'fe',                                      # 'Wife' -> 'Wives'
+                      last_two == 'lf',                                      # 'Elf' -> 'Elves'
+                      last.isin(('s', 'x', 'z', 'o')),                       # 'Class' -> 'Classes'
+                      last == 'f',                                           # 'Dwarf' -> 'Dwarves'
+                      (last == 'y') & ~second_last.isin(tuple('aeiou'))]     # 'City' -> 'Cities'
+        # String columns may yield nullable masks, which np.select doesn't accept.
+        conditions = [condition.to_numpy(dtype=bool, na_value=False) for condition in conditions]
+        choices = [nouns + 'es',
+                   nouns.str[:-2] + 'ves',
+                   nouns.str[:-1] + 'ves',
+                   nouns + 'es',
+                   nouns.str[:-1] + 'ves',
+                   nouns.str[:-1] + 'ies']
+        return pd.Series(np.select(conditions, choices, default=nouns + 's'), index=nouns.index)
 
     @staticmethod
-    def __dynamic_adjective(text : str) -> str:
-        '''Returns a basic adjective form of the given noun.'''
-        match text[-1]:
-            case 'f': return text[:-1] + 'ven' # 'Elf' -> 'Elven'
-        return text
+    def __dynamic_adjective(nouns : pd.Series) -> pd.Series:
+        '''Returns basic adjective forms of the given nouns.'''
+        return nouns.where(~nouns.str.endswith('f', na=False), nouns.str[:-1] + 'ven') # 'Elf' -> 'Elven'
 
     def to_tlk(self, tlk_path : str) -> None:
         '''Exports this TLK object to a TLK file.'''
-        # Sort the entries by ID before exporting.
-        self.values['entries'].sort(key=lambda entry: entry['id'])
-        # To export a TLK file, we first need to create a temporary JSON file.
-        with open(TLK.TEMP_FILE, 'w') as file:
-            json.dump(self.values, file)
-        # Once the JSON file exists, we can convert it to a TLK using the NWN_TLK.
-        subprocess.run([self.io.nwn_tlk,
-                        '-i', TLK.TEMP_FILE, # Input file [default: -]
-                        '-o', tlk_path])    # Output file [default: -]
-        # Safely remove the temporary JSON file.
-        TLK.__remove_temp_file__()
-
-    @staticmethod
-    def __remove_temp_file__():
-        '''Removes the temporary JSON file if it exists.'''
-        with contextlib.suppress(FileNotFoundError):
-            os.remove(TLK.TEMP_FILE)
+        # Sort the entries by ID, unless they're already in order. This is common, as most IDs are assigned incrementally.
+        ids = np.asarray(self.ids, dtype=np.int64)
+        if np.all(ids[1:] >= ids[:-1]):
+            entries = zip(self.ids, self.texts)
+        else:
+            order = np.argsort(ids, kind='stable')
+            entries = zip(ids[order].tolist(), [self.texts[i] for i in order.tolist()])
+        # Then convert them to nwn_tlk's JSON format before exporting.
+        values = {
+            'language': self.language,
+            'entries': [{'id': id, 'text': text, **self.extras[id]} if id in self.extras else {'id': id, 'text': text}
+                        for id, text in entries]
+        }
+        # Convert the JSON to a TLK using the NWN_TLK, piping it in via stdin.
+        # stdin has no file extension, so the input format must be given explicitly.
+        result = IOHelper.run_binary([self.io.nwn_tlk,
+                                      '-i', '-',            # Input file [default: -]
+                                      '--inform', 'json',   # Input format [default: autodetect]
+                                      '-o', tlk_path],      # Output file [default: -]
+                                     input=IOHelper.dump_json(values))
+        if result.returncode != 0:
+            # An error occurred during the conversion.
+            raise RuntimeError(f'Failed to write TLK file: {tlk_path}')
+
+    def __load_values__(self, values : dict) -> None:
+        '''Internal function. Replaces the contents of this TLK instance with values in nwn_tlk's JSON format.'''
+        self.language = values['language']
+        self.ids      = [entry['id'] for entry in values['entries']]
+        self.texts    = [entry['text'] for entry in values['entries']]
+        self.extras   = {entry['id']: {key: value for key, value in entry.items() if key not in ('id', 'text')}
+                         for entry in values['entries'] if len(entry) > 2}
+        self.existing = dict(zip(self.texts, self.ids))
+        self.max_id   = max(self.ids, default=-1)
+        # Find any missing ids and add them to the list of blanks. We'll fill them in later.
+        self.blanks = set(range(self.max_id)).difference(self.ids)
 
     @staticmethod
     def from_tlk(tlk_path : str, input_2da_folder : str, input_json_folder  : str, io_helper : IOHelper) -> 'TLK':
@@ -349,27 +477,21 @@ class TLK():
             # The file path is invalid.
             raise FileNotFoundError(f'Unable to proceed due to invalid TLK file path: {tlk_path}')
 
-        # Safely remove the temporary JSON file.
-        TLK.__remove_temp_file__()
-        # Convert the TLK file to a JSON file using the NWN_TLK.
-        subprocess.run([io_helper.nwn_tlk,
-                        '-i', tlk_path,
-                        '-o', TLK.TEMP_FILE])
-        if not os.path.isfile(TLK.TEMP_FILE):
+        # Convert the TLK file to JSON using the NWN_TLK, reading it from stdout.
+        # stdout has no file extension, so the output format must be given explicitly.
+        result = IOHelper.run_binary([io_helper.nwn_tlk,
+                                      '-i', tlk_path,
+                                      '-o', '-',
+                                      '--outform', 'json'],
+                                     stdin=subprocess.DEVNULL, stdout=subprocess.PIPE)
+        if result.returncode != 0 or not result.stdout:
             # An error occurred during the conversion.
             raise FileNotFoundError('Failed to convert TLK file.')
         # If the file was successfully converted, import it.
-        with open(TLK.TEMP_FILE, 'r') as file:
-            tlk = TLK(input_2da_folder = input_2da_folder,
-                      input_json_folder = input_json_folder,
-                      io_helper = io_helper)
-            tlk.values = json.load(file)
-            tlk.existing = {entry['text']: entry['id']
-                            for entry in tlk.values['entries']}
-            # Find any missing ids and add them to the list of blanks. We'll fill them in later.
-            tlk.blanks = {id for id in range(max(tlk.existing.values()))
-                          if id not in tlk.existing.values()}
-        TLK.__remove_temp_file__()
+        tlk = TLK(input_2da_folder = input_2da_folder,
+                  input_json_folder = input_json_folder,
+                  io_helper = io_helper)
+        tlk.__load_values__(IOHelper.load_json(result.stdout))
         return tlk
 
     @staticmethod
@@ -378,21 +500,16 @@ class TLK():
         # Ensure the given path is valid.
         if not os.path.isfile(json_path) or not json_path.lower().endswith('.json'):
             raise FileNotFoundError(f'Unable to proceed due to invalid JSON file path: {json_path}')
-        with open(json_path, 'r') as file:
+        with open(json_path, 'rb') as file:
             # Load and validate the JSON file.
-            values = json.load(file)
+            values = IOHelper.load_json(file.read())
             if len(values.keys()) != 2 or not ('language' in values and 'entries' in values):
                 raise ValueError(f'Unable to proceed due to invalid JSON format: {values.keys()}')
             # The JSON file is valid. Create a new TLK instance and import the values.
             tlk = TLK(input_2da_folder = input_2da_folder,
                       input_json_folder = input_json_folder,
                       io_helper = io_helper)
-            tlk.values = values
-            tlk.existing = {entry['text']: entry['id']
-                            for entry in tlk.values['entries']}
-            # Find any missing ids and add them to the list of blanks. We'll fill them in later.
-            tlk.blanks = {id for id in range(max(tlk.existing.values()))
-                          if id not in tlk.existing.values()}
+            tlk.__load_values__(values)
             return tlk
 
 class TlkBuilder():
@@ -464,20 +581,66 @@ class TlkBuilder():
     def process_2das(self, spell_name_desc_offset : int = 5000) -> Dict[str, pd.DataFrame]:
         '''Processes a 2DA file and updates the TLK object.'''
         print('Generating TLK references...')
-        # Parse all 2DA files and update the TLK with their JSON strings.
-        processed = {os.path.basename(file): self.tlk.add_2da_labels(os.path.basename(file)[:-4], spell_name_desc_offset)
-                     for file in sorted(glob(os.path.join(self.input_2das, f'*.2da')))}
-        # Also load 2DA files without corresponding json files to clear their whitespace and validate them.
-        processed.update({os.path.basename(file): IOHelper.read_2da(file, validate_index=False)
-                          for file in sorted(glob(os.path.join(self.static_2das, f'*.2da')))})
+        # Determine each file's name once, as (file name, path) pairs.
+        input_files  = [(os.path.basename(file), file) for file in sorted(glob(os.path.join(self.input_2das, f'*.2da')))]
+        static_files = [(os.path.basename(file), file) for file in sorted(glob(os.path.join(self.static_2das, f'*.2da')))]
+        # Read each 2DA file with its JSON labels. Also load 2DA files without corresponding json files to clear
+        # their whitespace and validate them.
+        reads = [(TLK.read_2da_labels, file_name[:-4], self.input_2das, self.input_json) for file_name, _ in input_files] + \
+                [(IOHelper.read_2da, file, False) for _, file in static_files]
+        # Windows supports at most 61 workers.
+        max_workers = min(os.cpu_count() or 1, 61) if sys.platform == 'win32' else os.cpu_count() or 1
+        workers = max(1, min(len(reads), max_workers))
+        if workers == 1:
+            # A single worker would only add the cost of starting it and pickling each DataFrame, so read them here.
+            results = (function(*args) for function, *args in reads)
+            return self.__add_2das__(input_files, static_files, results, spell_name_desc_offset)
+        # Parsing the files is independent of the TLK, so we'll read them in parallel.
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            results = TlkBuilder.__replay__(executor, executor.map(TlkBuilder.__read_quietly__, reads))
+            return self.__add_2das__(input_files, static_files, results, spell_name_desc_offset)
+
+    def __add_2das__(self, input_files : List[tuple], static_files : List[tuple], results,
+                     spell_name_desc_offset : int) -> Dict[str, pd.DataFrame]:
+        '''Internal function. Updates the TLK with the results of process_2das' reads, given in file order.'''
+        # Update the TLK with their JSON strings in order, so the assigned IDs remain the same across runs.
+        processed = {file_name: self.tlk.add_2da_labels(file_name[:-4], spell_name_desc_offset, labels=next(results))
+                     for file_name, _ in input_files}
+        processed.update({file_name: next(results) for file_name, _ in static_files})
         return processed
 
+    @staticmethod
+    def __read_quietly__(read : tuple) -> tuple:
+        '''Internal function. Runs a read in a worker process, returning its messages and exit code alongside its result.'''
+        function, *args = read
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                result = function(*args)
+        except SystemExit as e:
+            # The read reported an error and stopped. Pass its exit code on, so the main process stops in turn.
+            return output.getvalue(), None, e.code
+        return output.getvalue(), result, None
+
+    @staticmethod
+    def __replay__(executor : concurrent.futures.Executor, reads):
+        '''Internal function. Prints the messages of each parallel read in file order, stopping at the first error.'''
+        for output, result, exit_code in reads:
+            print(output, end='')
+            if exit_code is not None:
+                # Like a serial run, skip the remaining files instead of waiting for them.
+                executor.shutdown(wait=False, cancel_futures=True)
+                exit(exit_code)
+            yield result
+
     def write_output(self, updated_2das : Dict[str, pd.DataFrame]) -> None:
         '''Writes the updated TLK and 2DA files to the output directory.'''
         # Write the updated TLK and 2DA files to the output directory.
         self.tlk.to_tlk(os.path.join(self.output_dir, 'tlk', self.tlk_name))
-        for name, df in updated_2das.items():
-            IOHelper.write_2da(df, os.path.join(TLK.TEMP_DIR, name))
+        # The 2DA files are independent of each other, so we'll write them concurrently.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 2)) as executor:
+            list(executor.map(IOHelper.write_2da, updated_2das.values(),
+                              [os.path.join(TLK.TEMP_DIR, name) for name in updated_2das]))
 
         # Package the output directory into a HAK file, then wipe the temporary directory.
         self.io.write_hak(TLK.TEMP_DIR, os.path.join(self.output_dir, 'hak', self.hak_name))